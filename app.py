@@ -1,40 +1,89 @@
+import io
 import os
+import re
+import csv
+import sys
+import json
+import asyncio
+import hashlib
+import functools
 import logging
-from typing import Dict, Any, List, Union, Optional
+import textwrap
+from collections import OrderedDict
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Union, Optional, Iterator
+import yaml
+import httpx
+import tiktoken
 from dotenv import load_dotenv
 import streamlit as st
+from streamlit.errors import StreamlitSecretNotFoundError
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-def validate_env_vars() -> None:
-    """Validate API key is available in environment."""
-    api_key = None
-    
-    # Try getting from streamlit secrets first
+def _load_api_key() -> Optional[str]:
+    """Read the API key from Streamlit secrets, falling back to the environment."""
     try:
         api_key = st.secrets["OPENAI_API_KEY"]
-        os.environ["OPENAI_API_KEY"] = api_key
-    except:
+    except (FileNotFoundError, KeyError, StreamlitSecretNotFoundError):
         # Fall back to environment variable
-        api_key = os.getenv("OPENAI_API_KEY")
+        return os.getenv("OPENAI_API_KEY")
     
-    if not api_key:
+    os.environ["OPENAI_API_KEY"] = api_key
+    return api_key
+
+@functools.lru_cache(maxsize=1)
+def validate_env_vars() -> None:
+    """Validate API key is available in environment."""
+    if not _API_KEY:
         raise ValueError("OPENAI_API_KEY not found in Streamlit secrets or environment variables.")
     logger.info("API key configured successfully")
 
-# Load environment variables
+# Load environment variables and resolve the API key once per process
 load_dotenv()
+_API_KEY = _load_api_key()
+
+# RedisSemanticCache compares vector distances, so lower is stricter; its default of
+# 0.2 is loose enough to match notes from an unrelated meeting
+SEMANTIC_CACHE_DISTANCE = 0.05
+
+@st.cache_resource
+def get_semantic_cache() -> Optional["BaseCache"]:
+    """Redis semantic cache for the minutes model, or None when REDIS_URL is not configured."""
+    redis_url = os.getenv("REDIS_URL")
+    if not redis_url:
+        return None
+    
+    try:
+        from langchain_community.cache import RedisSemanticCache
+        from langchain_openai import OpenAIEmbeddings
+        
+        cache = RedisSemanticCache(
+            redis_url=redis_url,
+            embedding=OpenAIEmbeddings(model="text-embedding-3-small"),
+            score_threshold=SEMANTIC_CACHE_DISTANCE
+        )
+        logger.info("Semantic LLM cache enabled")
+        return cache
+    except Exception as e:
+        logger.warning(f"Could not enable semantic LLM cache: {e}")
+        return None
 
 # Modern imports
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
-from langchain_core.output_parsers import StrOutputParser, PydanticOutputParser
-from langchain_core.runnables import RunnablePassthrough, RunnableParallel
-from langchain_core.messages import SystemMessage, HumanMessage, AIMessage
-from pydantic import BaseModel, Field, validator
+from langchain_core.output_parsers import StrOutputParser
+from langchain_core.runnables import RunnablePassthrough, RunnableParallel, RunnableLambda
+from langchain_core.messages import SystemMessage, HumanMessage, AIMessage, convert_to_openai_messages, trim_messages
+from langchain_core.caches import BaseCache, InMemoryCache
+from langchain_core.outputs import Generation
+from pydantic import BaseModel, Field, ValidationError, field_validator
 from datetime import datetime
+from openai import AsyncOpenAI, RateLimitError
+from openai.lib._parsing import type_to_response_format_param
 
 # ------------------------------
 # Pydantic Models for Structured Output
@@ -43,13 +92,14 @@ from datetime import datetime
 class MeetingInfo(BaseModel):
     """Model for storing basic meeting information."""
     company_name: Optional[str] = Field(default="Not Specified", description="Name of the company")
-    participants: List[str] = Field(default_factory=list, description="List of meeting participants")
+    participants: List[str] = Field(default_factory=list, validate_default=True, description="List of meeting participants")
     location: Optional[str] = Field(default="Not Specified", description="Where the meeting took place")
     duration: Optional[str] = Field(default="Not Specified", description="How long the meeting lasted")
     employee_count: Optional[int] = Field(default=None, description="Number of employees at the company")
     management_levels: Optional[int] = Field(default=None, description="Number of management levels")
     
-    @validator('participants', pre=True, always=True)
+    @field_validator('participants', mode='before')
+    @classmethod
     def handle_participants(cls, v):
         if not v:
             return ["Not Specified"]
@@ -71,163 +121,563 @@ class MeetingMinutes(BaseModel):
     follow_up_date: Optional[str] = Field(default="Not Set", description="When to check in on progress")
     additional_notes: Optional[str] = Field(default="No additional notes", description="Any additional relevant information")
 
+# ------------------------------
+# Prompt Templates
+# ------------------------------
+# System prompts are static module-level constants so every request sends a
+# byte-identical prefix that OpenAI can serve from its prompt cache. Anything
+# dynamic (notes, chat input) belongs in the human turn.
+
+PROMPT_CACHE_KEY = "mom_v1"
+
+# Batches larger than this go through the OpenAI Batch API (50% cheaper, asynchronous)
+BATCH_API_THRESHOLD = 100
+
+# Context window shared by gpt-4o and gpt-4o-mini, minus room for the longest reply
+# (gpt-4o's output cap) and for the system prompt and structured output schema
+MODEL_CONTEXT_TOKENS = 128000
+MAX_OUTPUT_TOKENS = 16384
+PROMPT_OVERHEAD_TOKENS = 2000
+
+# Notes longer than this do not fit one request, so they are condensed chunk by chunk first
+MAX_INPUT_TOKENS = MODEL_CONTEXT_TOKENS - MAX_OUTPUT_TOKENS - PROMPT_OVERHEAD_TOKENS
+INPUT_CHUNK_TOKENS = 8000
+
+# Only the most recent chat history within this budget is sent on each interview turn
+CHAT_HISTORY_TOKEN_LIMIT = 2000
+
+# Bump whenever MeetingMinutes changes so cached structured results are not reused
+SCHEMA_VERSION = "1"
+
+INTERVIEW_SYSTEM_TEMPLATE = """You are an AI meeting assistant that helps extract key information for meeting minutes.
+Extract the meeting details from the notes provided.
+If any information is missing, use "Not Specified" for text fields, empty lists for lists, and null for numbers."""
+
+CHAT_SYSTEM_TEMPLATE = """You are a meeting assistant interviewing the user to gather information for meeting minutes.
+Ask: company, attendees, location, duration, headcount, management levels.
+Then probe: strategic goals, development focus, challenges.
+Close with: action items, owners, follow-up date. Confirm nothing is missing.
+Be conversational but efficient: one question at a time, wait for each answer."""
+
+CONDENSE_SYSTEM_TEMPLATE = """You condense one part of a long meeting transcript into concise notes.
+Keep every fact needed for minutes: names and roles, company details, goals, challenges, decisions,
+action items with owners and due dates, follow-up dates. Output plain notes only."""
+
+# Focused prompts for generating the minutes section by section in parallel
+SECTION_RULES = """Output only the section body in markdown, without a heading.
+Mark missing details "Not Specified"; never invent them."""
+
+DETAILS_SYSTEM_TEMPLATE = """You write the meeting details section of meeting minutes.
+List as bullets: company, participants (with roles), location, duration, headcount, management levels.
+""" + SECTION_RULES
+
+DISCUSSION_SYSTEM_TEMPLATE = """You write the discussion section of meeting minutes for stakeholders.
+Summarize strategic goals, development focus, challenges and any other points discussed, using short subsections and bullets.
+""" + SECTION_RULES
+
+ACTION_ITEMS_SYSTEM_TEMPLATE = """You write the action items section of meeting minutes.
+Produce a markdown table with columns Action, Owner, Due, followed by the follow-up date on its own line.
+""" + SECTION_RULES
+
+# Compiled once per process rather than on every chain construction
+INTERVIEW_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", INTERVIEW_SYSTEM_TEMPLATE),
+    ("human", "Extract the meeting information from this input: {input}")
+])
+
+CHAT_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", CHAT_SYSTEM_TEMPLATE),
+    MessagesPlaceholder(variable_name="chat_history"),
+    ("human", "{input}")
+])
+
+CONDENSE_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", CONDENSE_SYSTEM_TEMPLATE),
+    ("human", "Transcript part: {input}")
+])
+
+DETAILS_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", DETAILS_SYSTEM_TEMPLATE),
+    ("human", "Meeting notes: {input}")
+])
+
+DISCUSSION_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", DISCUSSION_SYSTEM_TEMPLATE),
+    ("human", "Meeting notes: {input}")
+])
+
+ACTION_ITEMS_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", ACTION_ITEMS_SYSTEM_TEMPLATE),
+    ("human", "Meeting notes: {input}")
+])
+
+# (prompt, LLM role) for each independently generated section of the minutes
+MINUTES_SECTIONS = {
+    "details": (DETAILS_PROMPT, "extract"),
+    "discussion": (DISCUSSION_PROMPT, "format"),
+    "actions": (ACTION_ITEMS_PROMPT, "extract"),
+}
+
 # ------------------------------
 # Utility Functions
 # ------------------------------
 
-def initialize_llm(model_name: str = "gpt-4", temperature: float = 0.7) -> ChatOpenAI:
-    """Initialize the language model with API key from environment."""
+OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1")
+
+# One keep-alive pool shared by every model; HTTP/2 lets concurrent calls multiplex over it
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=40)
+HTTP_TIMEOUT = httpx.Timeout(600.0, connect=10.0)
+PREWARM_TIMEOUT = 5.0
+
+@st.cache_resource
+def get_http_client() -> httpx.Client:
+    """Shared HTTP/2 client for sync OpenAI calls, pre-warmed so the first request skips the handshake."""
+    client = httpx.Client(http2=True, limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
     try:
-        # Make sure API key is set
-        validate_env_vars()
-        
+        # Short timeout: this runs on the first page load and must not stall it
+        headers = {"Authorization": f"Bearer {_API_KEY}"} if _API_KEY else {}
+        client.get(f"{OPENAI_BASE_URL}/models", headers=headers, timeout=PREWARM_TIMEOUT)
+    except httpx.HTTPError as e:
+        logger.warning(f"Could not pre-warm OpenAI connection: {e}")
+    return client
+
+# (model, temperature) per task: extraction is cheap and deterministic,
+# the user-facing minutes use the stronger model
+LLM_ROLES = {
+    "extract": ("gpt-4o-mini", 0.0),
+    "chat": ("gpt-4o-mini", 0.7),
+    "format": ("gpt-4o", 0.3),
+}
+
+@st.cache_resource
+def initialize_llm(role: str = "format") -> ChatOpenAI:
+    """Initialize the language model for a task role, cached per role."""
+    try:
+        model_name, temperature = LLM_ROLES[role]
         return ChatOpenAI(
-            model_name=model_name, 
-            temperature=temperature
+            model_name=model_name,
+            temperature=temperature,
+            # Report token usage on streamed responses too
+            stream_usage=True,
+            # Keep requests sharing the static system prompts on the same prompt cache
+            extra_body={"prompt_cache_key": PROMPT_CACHE_KEY},
+            # Opt-in via REDIS_URL and limited to the discussion section's model. A near match is
+            # still another meeting's summary, shared across every user of this server.
+            cache=get_semantic_cache() if role == "format" else None,
+            # Only the sync client is shared: pooled async connections are bound to the event
+            # loop that opened them, and each asyncio.run starts a new one
+            http_client=get_http_client()
         )
     except Exception as e:
         logger.error(f"Error initializing ChatOpenAI: {e}")
         raise
 
+@functools.lru_cache(maxsize=1)
+def get_encoder() -> tiktoken.Encoding:
+    """Token encoder for gpt-4o, loaded on first use since that may download the BPE file."""
+    return tiktoken.encoding_for_model("gpt-4o")
+
+def split_meeting_input(text: str, max_tokens: int = INPUT_CHUNK_TOKENS) -> List[str]:
+    """Split notes on paragraph boundaries into chunks of at most max_tokens tokens."""
+    enc = get_encoder()
+    chunks: List[str] = []
+    current: List[str] = []
+    current_tokens = 0
+    
+    for paragraph in text.split("\n\n"):
+        tokens = enc.encode(paragraph)
+        if len(tokens) > max_tokens:
+            # A single oversized paragraph is cut on token boundaries
+            pieces = [enc.decode(tokens[i:i + max_tokens]) for i in range(0, len(tokens), max_tokens)]
+        else:
+            pieces = [paragraph]
+        
+        for piece in pieces:
+            piece_tokens = len(tokens) if len(pieces) == 1 else len(enc.encode(piece))
+            if current and current_tokens + piece_tokens > max_tokens:
+                chunks.append("\n\n".join(current))
+                current, current_tokens = [], 0
+            current.append(piece)
+            current_tokens += piece_tokens
+    
+    if current:
+        chunks.append("\n\n".join(current))
+    return chunks
+
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+def normalize_meeting_input(user_responses: str) -> str:
+    """Collapse insignificant whitespace so trivially different notes share cache entries."""
+    lines = (" ".join(line.split()) for line in user_responses.strip().splitlines())
+    return _BLANK_LINES_RE.sub("\n\n", "\n".join(lines))
+
+def render_meeting_yaml(meeting_minutes: MeetingMinutes) -> str:
+    """Render structured meeting data as compact YAML, with action items as a CSV table."""
+    # "Not Specified" style defaults carry no information, so they are left out
+    data = meeting_minutes.model_dump(exclude_none=True, exclude_defaults=True, exclude={"action_items"})
+    rendered = yaml.safe_dump(data, sort_keys=False, default_flow_style=False) if data else ""
+    
+    if meeting_minutes.action_items:
+        # A CSV block avoids repeating the field names for every action item
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerow(["description", "owner", "due_date"])
+        writer.writerows([item.description, item.owner, item.due_date] for item in meeting_minutes.action_items)
+        rendered += "action_items: |\n" + textwrap.indent(buffer.getvalue(), "  ")
+    return rendered
+
+# Entries kept by the in-process caches below; least recently used entries are evicted first
+STRUCTURED_CACHE_SIZE = 256
+MINUTES_CACHE_SIZE = 64
+
+# Exact-match cache for structured extraction; semantic matches are too risky for
+# JSON fields, so only identical (normalized) notes are served from here.
+_structured_cache: "OrderedDict[str, MeetingMinutes]" = OrderedDict()
+
+def _structured_cache_key(normalized_input: str) -> str:
+    return hashlib.sha256(f"{SCHEMA_VERSION}\n{normalized_input}".encode("utf-8")).hexdigest()
+
+def _get_cached_structured_data(normalized_input: str) -> Optional[MeetingMinutes]:
+    key = _structured_cache_key(normalized_input)
+    cached = _structured_cache.get(key)
+    if cached is None:
+        return None
+    _structured_cache.move_to_end(key)
+    return cached.model_copy(deep=True)
+
+def _cache_structured_data(normalized_input: str, structured_data: MeetingMinutes) -> None:
+    key = _structured_cache_key(normalized_input)
+    _structured_cache[key] = structured_data.model_copy(deep=True)
+    _structured_cache.move_to_end(key)
+    if len(_structured_cache) > STRUCTURED_CACHE_SIZE:
+        _structured_cache.popitem(last=False)
+
 # ------------------------------
 # Chain Components
 # ------------------------------
 
 def create_structured_interview_chain(llm: ChatOpenAI):
     """Create a chain that conducts the interview and outputs structured data."""
-    
-    interview_system_template = """You are an AI meeting assistant that helps extract key information for meeting minutes.
-You MUST respond with valid JSON that matches this exact structure:
-
-{
-    "meeting_info": {
-        "company_name": "string",
-        "participants": ["string"],
-        "location": "string",
-        "duration": "string",
-        "employee_count": null or number,
-        "management_levels": null or number
-    },
-    "strategic_goals": ["string"],
-    "development_focus": "string",
-    "challenges": ["string"],
-    "action_items": [
-        {
-            "description": "string",
-            "owner": "string",
-            "due_date": "string"
-        }
-    ],
-    "follow_up_date": "string",
-    "additional_notes": "string"
-}
+    # Bind the schema through OpenAI structured outputs instead of spelling it out in the prompt.
+    # Passing the pydantic class already makes the SDK send a strict schema; strict=True says so.
+    structured_llm = llm.with_structured_output(MeetingMinutes, method="json_schema", strict=True)
+    return (INTERVIEW_PROMPT | structured_llm).with_config({"run_name": "Structured Interview Chain"})
 
-If any information is missing, use "Not Specified" for strings, [] for arrays, and null for numbers.
-IMPORTANT: Your response must be valid JSON and nothing else."""
-    
-    interview_prompt = ChatPromptTemplate.from_messages([
-        ("system", interview_system_template),
-        ("human", "Generate valid JSON with meeting information from this input: {input}")
-    ])
-    
-    # Create parser for structured output
-    parser = PydanticOutputParser(pydantic_object=MeetingMinutes)
-    
-    # Create the Interview Chain with LCEL
-    return (
-        interview_prompt 
-        | llm 
-        | parser
-    ).with_config({"run_name": "Structured Interview Chain"})
+def create_section_message_chain(section: str, llm: ChatOpenAI):
+    """Create the chain for one minutes section, returning the raw AIMessage (keeps usage_metadata, streams chunks)."""
+    prompt, _ = MINUTES_SECTIONS[section]
+    return (prompt | llm).with_config({"run_name": f"MoM {section.title()} Section Chain"})
 
-def create_mom_chain(llm: ChatOpenAI):
-    """Create the MoM generation chain using structured data."""
-    
-    mom_system_template = """You are a professional meeting assistant who creates detailed, well-formatted meeting minutes.
-Using the structured data provided, create a comprehensive meeting minutes document that is ready to share with stakeholders.
+def create_condense_chain(llm: ChatOpenAI):
+    """Create the map step that condenses one chunk of an oversized transcript."""
+    return (CONDENSE_PROMPT | llm | StrOutputParser()).with_config({"run_name": "Condense Chain"})
 
-Format the document using markdown for readability, with clear sections, bullet points, and highlighting of key information.
-The tone should be professional and the content should be actionable."""
-    
-    mom_prompt = ChatPromptTemplate.from_messages([
-        ("system", mom_system_template),
-        ("human", "Generate professional meeting minutes from this structured data: {structured_data}")
-    ])
-    
-    # Create the MoM Generation Chain with LCEL
+def _format_sectioned_minutes(sections: Dict[str, str]) -> str:
+    """Stitch the independently generated sections into one minutes document."""
+    return (
+        "# Meeting Minutes\n\n"
+        f"## Meeting Details\n\n{sections['details'].strip()}\n\n"
+        f"## Discussion\n\n{sections['discussion'].strip()}\n\n"
+        f"## Action Items\n\n{sections['actions'].strip()}\n"
+    )
+
+def create_sectioned_mom_chain(extract_llm: ChatOpenAI, format_llm: ChatOpenAI):
+    """Create a MoM chain that generates each section concurrently and concatenates them."""
+    # Each section runs on the model of its role in MINUTES_SECTIONS
+    llms = {"extract": extract_llm, "format": format_llm}
     return (
-        mom_prompt 
-        | llm 
-        | StrOutputParser()
-    ).with_config({"run_name": "Enhanced MoM Generation Chain"})
+        RunnableParallel({
+            section: create_section_message_chain(section, llms[role]) | StrOutputParser()
+            for section, (_, role) in MINUTES_SECTIONS.items()
+        })
+        | RunnableLambda(_format_sectioned_minutes)
+    ).with_config({"run_name": "Sectioned MoM Generation Chain"})
+
+def create_meeting_chain(extract_llm: ChatOpenAI, format_llm: ChatOpenAI):
+    """Create a chain that extracts structured data and generates the minutes concurrently."""
+    # Both branches only depend on the raw input, so they run in parallel
+    return RunnableParallel(
+        structured_data=create_structured_interview_chain(extract_llm),
+        meeting_minutes=create_sectioned_mom_chain(extract_llm, format_llm)
+    ).with_config({"run_name": "Meeting Chain"})
 
 def create_interactive_chain(llm: ChatOpenAI):
-    """Create an interactive chat chain with memory."""
-    
-    system_template = """You are a helpful meeting assistant conducting an interview to gather information for meeting minutes.
-Ask questions one at a time to gather all essential information for comprehensive meeting minutes.
-
-Start with these essential questions:
-1. What is the name of the company?
-2. Who was present at the meeting?
-3. Where did the meeting take place?
-4. How long did the meeting last?
-5. How many employees does the company have?
-6. How many levels of management does the company have?
-
-Then explore:
-- Strategic goals
-- Development focus
-- Challenges
-- Action items and responsibilities
-- Follow-up timing
-
-Be conversational but efficient. Ask one question at a time and wait for a response before moving to the next question."""
-
-    chat_prompt = ChatPromptTemplate.from_messages([
-        ("system", system_template),
-        MessagesPlaceholder(variable_name="chat_history"),
-        ("human", "{input}")
-    ])
-    
-    return chat_prompt | llm
+    """Create an interactive chat chain with memory, trimmed to a token window."""
+    # Keep per-turn context bounded instead of replaying the whole interview
+    trimmer = trim_messages(
+        max_tokens=CHAT_HISTORY_TOKEN_LIMIT,
+        strategy="last",
+        token_counter=llm,
+        start_on="human"
+    )
+    return RunnablePassthrough.assign(chat_history=itemgetter("chat_history") | trimmer) | CHAT_PROMPT | llm
+
+# Chains are stateless, so a single instance is shared by every session
+
+@st.cache_resource
+def get_interview_chain():
+    return create_structured_interview_chain(initialize_llm("extract"))
+
+@st.cache_resource
+def get_condense_chain():
+    return create_condense_chain(initialize_llm("extract"))
+
+@st.cache_resource
+def get_section_message_chain(section: str):
+    return create_section_message_chain(section, initialize_llm(MINUTES_SECTIONS[section][1]))
+
+@st.cache_resource
+def get_sectioned_mom_chain():
+    return create_sectioned_mom_chain(initialize_llm("extract"), initialize_llm("format"))
+
+@st.cache_resource
+def get_meeting_chain():
+    return create_meeting_chain(initialize_llm("extract"), initialize_llm("format"))
+
+@st.cache_resource
+def get_interactive_chain():
+    return create_interactive_chain(initialize_llm("chat"))
 
 # ------------------------------
 # Main Process Functions
 # ------------------------------
 
-def process_meeting_data(user_responses: str) -> Dict[str, Any]:
+def _needs_condensing(normalized_input: str) -> bool:
+    token_count = len(get_encoder().encode(normalized_input))
+    if token_count <= MAX_INPUT_TOKENS:
+        return False
+    logger.info(f"Meeting notes are {token_count} tokens, condensing before generating minutes")
+    return True
+
+async def _aprepare_meeting_input(normalized_input: str) -> str:
+    """Map-reduce oversized notes into condensed notes that fit a single request."""
+    if not _needs_condensing(normalized_input):
+        return normalized_input
+    chunks = split_meeting_input(normalized_input)
+    condensed = await get_condense_chain().abatch([{"input": chunk} for chunk in chunks])
+    return "\n\n".join(condensed)
+
+# Memoized so extraction and minutes for the same notes share one condensation
+@functools.lru_cache(maxsize=8)
+def _prepare_meeting_input(normalized_input: str) -> str:
+    """Synchronous counterpart of _aprepare_meeting_input."""
+    if not _needs_condensing(normalized_input):
+        return normalized_input
+    chunks = split_meeting_input(normalized_input)
+    condensed = get_condense_chain().batch([{"input": chunk} for chunk in chunks])
+    return "\n\n".join(condensed)
+
+async def process_meeting_data(user_responses: str) -> Dict[str, Any]:
     """Process meeting data and generate minutes."""
     try:
-        llm = initialize_llm()
-        
-        # Create chains
-        structured_chain = create_structured_interview_chain(llm)
-        mom_chain = create_mom_chain(llm)
-        
-        try:
-            # Extract structured data
-            structured_data = structured_chain.invoke({"input": user_responses})
-        except Exception as e:
-            logger.warning(f"Error parsing response: {e}")
-            # Use default values if parsing fails
-            structured_data = MeetingMinutes()
+        normalized_input = normalize_meeting_input(user_responses)
         
-        # Generate formatted meeting minutes
-        minutes = mom_chain.invoke({"structured_data": structured_data.json()})
+        structured_data = _get_cached_structured_data(normalized_input)
+        meeting_input = await _aprepare_meeting_input(normalized_input)
+        if structured_data is not None:
+            # Structured data is cached, only the minutes need generating
+            return {
+                "structured_data": structured_data,
+                "meeting_minutes": await get_sectioned_mom_chain().ainvoke({"input": meeting_input})
+            }
         
-        return {
-            "structured_data": structured_data,
-            "meeting_minutes": minutes
-        }
+        # Extract structured data and generate formatted minutes in one concurrent pass
+        results = await get_meeting_chain().ainvoke({"input": meeting_input})
+        _cache_structured_data(normalized_input, results["structured_data"])
+        return results
     except Exception as e:
         logger.error(f"Error processing meeting data: {e}")
         raise
 
+def generate_meeting_minutes(user_responses: str) -> str:
+    """Generate only the meeting minutes, synchronously on the shared HTTP client."""
+    # No structured extraction: callers that only render the minutes should not pay
+    # for it, or fail when it does
+    meeting_input = _prepare_meeting_input(normalize_meeting_input(user_responses))
+    return get_sectioned_mom_chain().invoke({"input": meeting_input})
+
+async def process_meetings_batch(inputs: List[str], max_concurrency: int = 10) -> List[Dict[str, Any]]:
+    """Process several meetings, with at most max_concurrency requests in flight.
+    
+    A meeting that fails is logged and its structured_data and meeting_minutes are None.
+    """
+    normalized_inputs = [normalize_meeting_input(user_responses) for user_responses in inputs]
+    meeting_inputs = await asyncio.gather(*(_aprepare_meeting_input(n) for n in normalized_inputs))
+    
+    if len(normalized_inputs) > BATCH_API_THRESHOLD:
+        return await _process_meetings_openai_batch(normalized_inputs, meeting_inputs)
+    
+    # Back off with jitter on rate limits so a burst does not fail the whole batch
+    meeting_chain = get_meeting_chain().with_retry(
+        retry_if_exception_type=(RateLimitError,),
+        wait_exponential_jitter=True,
+        stop_after_attempt=5
+    )
+    results = await meeting_chain.abatch(
+        [{"input": meeting_input} for meeting_input in meeting_inputs],
+        config={"max_concurrency": max_concurrency},
+        # One failing meeting must not discard the rest of the batch
+        return_exceptions=True
+    )
+    
+    for index, (normalized_input, result) in enumerate(zip(normalized_inputs, results)):
+        if isinstance(result, Exception):
+            logger.warning(f"Meeting {index} failed: {result}")
+            results[index] = {"structured_data": None, "meeting_minutes": None}
+            continue
+        _cache_structured_data(normalized_input, result["structured_data"])
+    return results
+
+def _batch_request(custom_id: str, llm: ChatOpenAI, messages: List[Any], **body: Any) -> Dict[str, Any]:
+    """Build one line of an OpenAI Batch API input file."""
+    return {
+        "custom_id": custom_id,
+        "method": "POST",
+        "url": "/v1/chat/completions",
+        "body": {
+            "model": llm.model_name,
+            "temperature": llm.temperature,
+            "messages": convert_to_openai_messages(messages),
+            **body
+        }
+    }
+
+async def _process_meetings_openai_batch(
+    normalized_inputs: List[str],
+    meeting_inputs: List[str],
+    poll_interval: float = 5.0,
+    max_poll_interval: float = 300.0
+) -> List[Dict[str, Any]]:
+    """Run extraction and minutes generation for many meetings through the OpenAI Batch API."""
+    extract_llm = initialize_llm("extract")
+    # The async client lives only as long as this event loop
+    async with AsyncOpenAI(
+        http_client=httpx.AsyncClient(http2=True, limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+    ) as client:
+        # The same strict schema the SDK sends for live extraction
+        structured_format = type_to_response_format_param(MeetingMinutes)
+        requests = []
+        for index, meeting_input in enumerate(meeting_inputs):
+            requests.append(_batch_request(
+                f"{index}-structured_data", extract_llm,
+                INTERVIEW_PROMPT.format_messages(input=meeting_input),
+                response_format=structured_format
+            ))
+            # Same sections as the sectioned chain, so the output does not depend on batch size
+            for section, (prompt, role) in MINUTES_SECTIONS.items():
+                requests.append(_batch_request(
+                    f"{index}-{section}", initialize_llm(role),
+                    prompt.format_messages(input=meeting_input)
+                ))
+        
+        payload = "\n".join(json.dumps(request) for request in requests)
+        input_file = await client.files.create(file=("meetings.jsonl", payload.encode("utf-8")), purpose="batch")
+        batch = await client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        logger.info(f"Submitted OpenAI batch {batch.id} with {len(requests)} requests")
+        
+        # Poll with exponential backoff until the batch reaches a terminal state
+        delay = poll_interval
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, max_poll_interval)
+            batch = await client.batches.retrieve(batch.id)
+        
+        if batch.status != "completed" or not batch.output_file_id:
+            raise RuntimeError(f"OpenAI batch {batch.id} finished with status '{batch.status}'")
+        
+        output = await client.files.content(batch.output_file_id)
+        results: List[Dict[str, Any]] = [{"structured_data": None, "meeting_minutes": None} for _ in normalized_inputs]
+        sections: List[Dict[str, str]] = [{} for _ in normalized_inputs]
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            index, key = record["custom_id"].split("-", 1)
+            response = record.get("response") or {}
+            if response.get("status_code") != 200:
+                logger.warning(f"Batch request {record['custom_id']} failed: {record.get('error') or response}")
+                continue
+            
+            content = response["body"]["choices"][0]["message"]["content"]
+            if key == "structured_data":
+                try:
+                    content = MeetingMinutes.model_validate_json(content)
+                except ValidationError as e:
+                    # One malformed record must not discard the rest of the batch
+                    logger.warning(f"Batch request {record['custom_id']} returned invalid data: {e}")
+                    continue
+                _cache_structured_data(normalized_inputs[int(index)], content)
+                results[int(index)][key] = content
+            else:
+                sections[int(index)][key] = content
+        
+        # Minutes are only assembled when every section came back
+        for index, meeting_sections in enumerate(sections):
+            if len(meeting_sections) == len(MINUTES_SECTIONS):
+                results[index]["meeting_minutes"] = _format_sectioned_minutes(meeting_sections)
+        
+        return results
+
+def extract_structured_data(user_responses: str) -> MeetingMinutes:
+    """Extract structured meeting data, reusing the result for identical notes."""
+    normalized_input = normalize_meeting_input(user_responses)
+    
+    structured_data = _get_cached_structured_data(normalized_input)
+    if structured_data is None:
+        structured_data = get_interview_chain().invoke({"input": _prepare_meeting_input(normalized_input)})
+        _cache_structured_data(normalized_input, structured_data)
+    return structured_data
+
+# LCEL streaming bypasses the LLM cache, so streamed minutes are cached here
+# keyed on (notes, section prompts) and replayed on a hit.
+_minutes_cache = InMemoryCache(maxsize=MINUTES_CACHE_SIZE)
+_MINUTES_CACHE_PROMPTS = "\n".join((DETAILS_SYSTEM_TEMPLATE, DISCUSSION_SYSTEM_TEMPLATE, ACTION_ITEMS_SYSTEM_TEMPLATE))
+
+def stream_meeting_minutes(user_responses: str) -> Iterator[str]:
+    """Stream the sectioned meeting minutes, in the same format as get_sectioned_mom_chain."""
+    normalized_input = normalize_meeting_input(user_responses)
+    
+    cached = _minutes_cache.lookup(normalized_input, _MINUTES_CACHE_PROMPTS)
+    if cached:
+        # Replay the cached minutes line by line so callers see the same stream shape
+        yield from cached[0].text.splitlines(keepends=True)
+        return
+    
+    inputs = {"input": _prepare_meeting_input(normalized_input)}
+    messages = {}
+    # The short sections are generated in the background while the discussion streams
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        details, actions = (
+            pool.submit(get_section_message_chain(section).invoke, inputs)
+            for section in ("details", "actions")
+        )
+        messages["details"] = details.result()
+        yield f"# Meeting Minutes\n\n## Meeting Details\n\n{messages['details'].content.strip()}\n\n## Discussion\n\n"
+        
+        message = None
+        for chunk in get_section_message_chain("discussion").stream(inputs):
+            message = chunk if message is None else message + chunk
+            yield chunk.content
+        if message is None:
+            return
+        messages["discussion"] = message
+        
+        messages["actions"] = actions.result()
+        yield f"\n\n## Action Items\n\n{messages['actions'].content.strip()}\n"
+    
+    for section, section_message in messages.items():
+        if section_message.usage_metadata:
+            logger.info(f"Meeting minutes {section} token usage: {section_message.usage_metadata}")
+    sections = {section: section_message.content for section, section_message in messages.items()}
+    _minutes_cache.update(normalized_input, _MINUTES_CACHE_PROMPTS, [Generation(text=_format_sectioned_minutes(sections))])
+
 def run_interactive_interview():
     """Run an interactive interview to collect meeting information."""
-    llm = initialize_llm()
-    chat_chain = create_interactive_chain(llm)
+    chat_chain = get_interactive_chain()
     
     chat_history = []
     print("Starting meeting minutes interview. Type 'exit' when you're finished.")
@@ -258,8 +708,42 @@ def run_interactive_interview():
     all_responses = "\n".join(collected_responses)
     return all_responses
 
+# ------------------------------
+# Demo Data
+# ------------------------------
+
+# Sample notes used by the CLI when no input is provided
+DEMO_INPUT = textwrap.dedent("""
+    Company: ABC Technologies
+    Participants: Sarah (CEO), Mike (CTO), Julie (HR Director), David (Team Lead)
+    Location: Virtual meeting via Zoom
+    Duration: 90 minutes
+    Company size: 85 employees
+    Management: 3 levels
+
+    Strategic goals discussed:
+    - Launch new product line Q3
+    - Expand into European market
+    - Improve employee retention by 15%
+
+    Development focus: Technical upskilling of mid-level managers
+
+    Challenges:
+    - Knowledge gaps in cloud architecture
+    - Limited training budget
+    - Rapid team growth causing communication issues
+
+    Action items:
+    - Julie to research training providers by next Friday
+    - Mike to outline skill requirements by Wednesday
+    - David to gather feedback from team by Monday
+    - Follow-up meeting scheduled for two weeks from now
+""").strip()
+
 if __name__ == "__main__":
     try:
+        validate_env_vars()
+        
         print("Welcome to the Advanced Meeting Minutes Assistant!")
         print("\n1: Enter meeting notes manually")
         print("2: Run interactive interview")
@@ -268,57 +752,28 @@ if __name__ == "__main__":
         
         if choice == "1":
             print("\nPlease provide your meeting notes (press Ctrl+D or Ctrl+Z on Windows when finished):")
-            user_input_lines = []
             
-            try:
-                while True:
-                    line = input()
-                    user_input_lines.append(line)
-            except (EOFError, KeyboardInterrupt):
-                pass
-                
-            user_responses = "\n".join(user_input_lines)
+            # Read the whole paste in one go rather than line by line
+            user_responses = sys.stdin.read()
             
             # If no input provided, use demonstration data
             if not user_responses.strip():
-                user_responses = """
-                Company: ABC Technologies
-                Participants: Sarah (CEO), Mike (CTO), Julie (HR Director), David (Team Lead)
-                Location: Virtual meeting via Zoom
-                Duration: 90 minutes
-                Company size: 85 employees
-                Management: 3 levels
-                
-                Strategic goals discussed:
-                - Launch new product line Q3
-                - Expand into European market
-                - Improve employee retention by 15%
-                
-                Development focus: Technical upskilling of mid-level managers
-                
-                Challenges: 
-                - Knowledge gaps in cloud architecture
-                - Limited training budget
-                - Rapid team growth causing communication issues
-                
-                Action items:
-                - Julie to research training providers by next Friday
-                - Mike to outline skill requirements by Wednesday
-                - David to gather feedback from team by Monday
-                - Follow-up meeting scheduled for two weeks from now
-                """
+                user_responses = DEMO_INPUT
         else:
             user_responses = run_interactive_interview()
             
-        # Process the data
-        results = process_meeting_data(user_responses)
+        # Extract and display the structured data
+        structured_data = extract_structured_data(user_responses)
         
-        # Display results
         print("\n--- Structured Meeting Data ---\n")
-        print(results["structured_data"])
+        print(render_meeting_yaml(structured_data))
         
+        # Stream the meeting minutes as they are generated
         print("\n--- Generated Meeting Minutes ---\n")
-        print(results["meeting_minutes"])
+        for chunk in stream_meeting_minutes(user_responses):
+            sys.stdout.write(chunk)
+            sys.stdout.flush()
+        print()
         
     except Exception as e:
         logger.error(f"An error occurred: {e}")
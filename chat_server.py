@@ -0,0 +1,113 @@
+import os
+import hmac
+import json
+from collections import OrderedDict, deque
+from typing import Any, Dict
+
+from fastapi import Depends, FastAPI, Header, HTTPException
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from langchain_core.messages import HumanMessage, AIMessage
+
+from app import get_interactive_chain, validate_env_vars, logger
+
+# ------------------------------
+# Chat Sidecar
+# ------------------------------
+# Serves the interview chat hot path as Server-Sent Events so each turn only
+# streams the new tokens instead of re-running the whole Streamlit script.
+# Run with: CHAT_SERVER_TOKEN=... uvicorn chat_server:api --port 8001
+
+validate_env_vars()
+
+# Every request must carry this bearer token, otherwise the sidecar would spend the
+# server's OpenAI key on behalf of anyone who can reach it
+CHAT_SERVER_TOKEN = os.getenv("CHAT_SERVER_TOKEN")
+if not CHAT_SERVER_TOKEN:
+    raise ValueError("CHAT_SERVER_TOKEN must be set to run the chat server.")
+
+# The Streamlit component iframe runs on the Streamlit host's origin
+ALLOWED_ORIGINS = os.getenv("CHAT_ALLOWED_ORIGINS", "http://localhost:8501").split(",")
+
+# Oldest sessions are dropped beyond this many so memory stays bounded
+MAX_SESSIONS = 1000
+
+api = FastAPI(title="Meeting Minutes Chat")
+api.add_middleware(
+    CORSMiddleware,
+    allow_origins=ALLOWED_ORIGINS,
+    allow_methods=["GET", "POST"],
+    allow_headers=["Authorization", "Content-Type"]
+)
+
+_sessions: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+class ChatRequest(BaseModel):
+    """One interview turn; sent as a JSON body so long notes stay out of URLs and access logs."""
+    session_id: str
+    message: str
+
+async def _check_token(authorization: str = Header(default="")) -> None:
+    if not hmac.compare_digest(authorization.encode(), f"Bearer {CHAT_SERVER_TOKEN}".encode()):
+        raise HTTPException(status_code=401, detail="Invalid or missing chat server token")
+
+def _get_session(session_id: str) -> Dict[str, Any]:
+    """Return the chat state for a session, creating it on first use."""
+    session = _sessions.get(session_id)
+    if session is None:
+        session = {"roles": [], "contents": [], "chat_history": deque(maxlen=20), "transcript": ""}
+        _sessions[session_id] = session
+        if len(_sessions) > MAX_SESSIONS:
+            _sessions.popitem(last=False)
+    else:
+        _sessions.move_to_end(session_id)
+    return session
+
+def _sse(data: Any, event: str = "message") -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+@api.post("/chat", dependencies=[Depends(_check_token)])
+async def chat(request: ChatRequest) -> StreamingResponse:
+    """Stream the assistant's reply to one interview turn as SSE."""
+    session = _get_session(request.session_id)
+    message = request.message
+
+    async def events():
+        chunks = []
+        try:
+            async for chunk in get_interactive_chain().astream({
+                "input": message,
+                "chat_history": list(session["chat_history"])
+            }):
+                if chunk.content:
+                    chunks.append(chunk.content)
+                    yield _sse(chunk.content)
+        except Exception as e:
+            logger.error(f"Error streaming chat response: {e}")
+            yield _sse(str(e), event="error")
+            return
+
+        full = "".join(chunks)
+        session["roles"].extend(["user", "assistant"])
+        session["contents"].extend([message, full])
+        session["transcript"] += ("\n" if session["transcript"] else "") + message
+        session["chat_history"].extend([
+            HumanMessage.model_construct(content=message),
+            AIMessage.model_construct(content=full)
+        ])
+        # Marks a complete reply, as opposed to a dropped connection
+        yield _sse(None, event="done")
+
+    return StreamingResponse(events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+# Async like /chat so both touch _sessions on the event loop thread, never the threadpool
+@api.get("/sessions/{session_id}", dependencies=[Depends(_check_token)])
+async def get_session(session_id: str) -> Dict[str, Any]:
+    """Return the messages and collected transcript of a session."""
+    session = _get_session(session_id)
+    return {
+        "roles": session["roles"],
+        "contents": session["contents"],
+        "transcript": session["transcript"]
+    }
@@ -1,9 +1,15 @@
+import os
+import json
+import uuid
+from collections import deque
+import httpx
 import streamlit as st
-from app import process_meeting_data, initialize_llm, create_interactive_chain
+import streamlit.components.v1 as components
+from app import get_interactive_chain, validate_env_vars
 from langchain_core.messages import HumanMessage, AIMessage
 
 # Custom CSS to position input at bottom
-st.markdown("""
+_CSS = """
     <style>
         .stChatFloatingInputContainer {
             position: fixed;
@@ -18,94 +24,271 @@ st.markdown("""
             padding-bottom: 100px;
         }
     </style>
-""", unsafe_allow_html=True)
+"""
 
-def init_session_state():
-    if "messages" not in st.session_state:
-        st.session_state.messages = [
-            {
-                "role": "assistant",
-                "content": """Welcome to the Advanced Meeting Minutes Assistant!
+@st.cache_resource
+def _inject_css():
+    # Cached so the style block is built once; Streamlit replays it on later reruns
+    st.markdown(_CSS, unsafe_allow_html=True)
+
+_inject_css()
+
+WELCOME = """Welcome to the Advanced Meeting Minutes Assistant!
 
 1: Enter meeting notes manually
 2: Run interactive interview
 
 Please select an option (1 or 2)"""
+
+NOTES_PROMPT = "Please enter your meeting notes directly:"
+
+INTERVIEW_START = """Let's start with some basic information:
+ What is the name of the company?"""
+
+INVALID_OPTION = "Please select either 1 or 2:"
+
+# Assistant reply for each valid option at the start of the conversation
+_OPTION_MSGS = {
+    "1": NOTES_PROMPT,
+    "2": INTERVIEW_START,
+}
+
+# When set, chat turns after the option prompt stream from the chat_server.py sidecar
+# over SSE instead of re-running this script on every message
+CHAT_SERVER_URL = os.getenv("CHAT_SERVER_URL", "").rstrip("/")
+# Must match the token the sidecar was started with
+CHAT_SERVER_TOKEN = os.getenv("CHAT_SERVER_TOKEN", "")
+
+# Chat rendered inside a component iframe; __SERVER__, __SESSION__ and __TOKEN__ are
+# substituted at render time. Plain DOM code, so no third-party script is loaded.
+_CHAT_COMPONENT = """
+<div style="font-family: sans-serif;">
+    <div id="messages"></div>
+    <form id="form">
+        <textarea id="draft" rows="3" placeholder="Type your response..." style="width: 80%;"></textarea>
+        <button id="send">Send</button>
+    </form>
+</div>
+<script>
+const server = __SERVER__, sessionId = __SESSION__;
+const headers = {"Authorization": `Bearer ${__TOKEN__}`};
+const list = document.getElementById("messages");
+const draft = document.getElementById("draft");
+const send = document.getElementById("send");
+
+function addMessage(role, content) {
+    const label = document.createElement("b");
+    label.textContent = `${role}: `;
+    const body = document.createElement("span");
+    body.textContent = content;
+    const p = document.createElement("p");
+    p.append(label, body);
+    list.append(p);
+    return body;
+}
+
+// EventSource can only GET, so the SSE frames of the POST response are parsed here
+async function readEvents(response, onEvent) {
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = "";
+    for (;;) {
+        const {value, done} = await reader.read();
+        if (done) return;
+        buffer += decoder.decode(value, {stream: true});
+        let end;
+        while ((end = buffer.indexOf("\\n\\n")) !== -1) {
+            let event = "message", data = "";
+            for (const line of buffer.slice(0, end).split("\\n")) {
+                if (line.startsWith("event: ")) event = line.slice(7);
+                else if (line.startsWith("data: ")) data += line.slice(6);
             }
-        ]
+            buffer = buffer.slice(end + 2);
+            onEvent(event, JSON.parse(data));
+        }
+    }
+}
+
+document.getElementById("form").addEventListener("submit", async (e) => {
+    e.preventDefault();
+    const message = draft.value.trim();
+    if (!message) return;
+    draft.value = "";
+    send.disabled = true;
+    addMessage("user", message);
+    const reply = addMessage("assistant", "");
+    try {
+        const response = await fetch(`${server}/chat`, {
+            method: "POST",
+            headers: {...headers, "Content-Type": "application/json"},
+            body: JSON.stringify({session_id: sessionId, message})
+        });
+        if (!response.ok) throw new Error(`chat server returned ${response.status}`);
+        await readEvents(response, (event, data) => {
+            if (event === "message") reply.textContent += data;
+            // Show the server's error instead of leaving an empty reply
+            else if (event === "error") reply.textContent = `Error: ${data}`;
+        });
+    } catch (err) {
+        reply.textContent = `Error: ${err.message}`;
+    } finally {
+        send.disabled = false;
+    }
+});
+
+fetch(`${server}/sessions/${sessionId}`, {headers})
+    .then((r) => r.json())
+    .then((s) => s.roles.forEach((role, i) => addMessage(role, s.contents[i])));
+</script>
+"""
+
+def init_session_state():
+    if "roles" not in st.session_state:
+        # Messages are kept as parallel role/content lists rather than a list of dicts
+        st.session_state.roles = []
+        st.session_state.contents = []
+        # The welcome message is rendered from WELCOME but still counts as a turn
+        st.session_state.turn_count = 1
         st.session_state.waiting_for_option = True  # Add this flag
     if "chat_history" not in st.session_state:
-        st.session_state.chat_history = []
-    if "collected_responses" not in st.session_state:
-        st.session_state.collected_responses = []
+        # Only the last 10 turns are kept, so per-turn prompt cost stays bounded
+        st.session_state.chat_history = deque(maxlen=20)
+    if "transcript" not in st.session_state:
+        # Responses are joined as they arrive so generating minutes does not rebuild the string
+        st.session_state.transcript = ""
+    if "chat_session_id" not in st.session_state:
+        st.session_state.chat_session_id = uuid.uuid4().hex
+
+def _add_message(role, content):
+    st.session_state.roles.append(role)
+    st.session_state.contents.append(content)
+    st.session_state.turn_count += 1
+
+def _record_response(response):
+    st.session_state.transcript += ("\n" if st.session_state.transcript else "") + response
+
+@st.fragment
+def _render_messages():
+    with st.chat_message("assistant"):
+        st.write(WELCOME)
+    for role, content in zip(st.session_state.roles, st.session_state.contents):
+        with st.chat_message(role):
+            st.write(content)
+
+def _handle_option(user_input):
+    next_message = _OPTION_MSGS.get(user_input)
+    if next_message is None:
+        # Invalid option: no LLM work is needed, so answer in place and stop here
+        _add_message("user", user_input)
+        _add_message("assistant", INVALID_OPTION)
+        with st.chat_message("user"):
+            st.write(user_input)
+        with st.chat_message("assistant"):
+            st.write(INVALID_OPTION)
+        return
+
+    st.session_state.waiting_for_option = False
+
+    # Add user choice and bot's next message
+    _add_message("user", user_input)
+    _add_message("assistant", next_message)
+    _record_response(user_input)
+    with st.chat_message("user"):
+        st.write(user_input)
+    with st.chat_message("assistant"):
+        st.write(next_message)
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _cached_minutes(transcript):
+    # Only needed once the user asks for minutes
+    from app import generate_meeting_minutes
+    
+    # Sectioned minutes only, run synchronously; identical transcripts are served from cache
+    return generate_meeting_minutes(transcript)
+
+def _uses_chat_server():
+    return bool(CHAT_SERVER_URL) and not st.session_state.waiting_for_option
+
+def _render_chat_component():
+    html = (_CHAT_COMPONENT
+            .replace("__SERVER__", json.dumps(CHAT_SERVER_URL))
+            .replace("__SESSION__", json.dumps(st.session_state.chat_session_id))
+            .replace("__TOKEN__", json.dumps(CHAT_SERVER_TOKEN)))
+    components.html(html, height=500, scrolling=True)
+
+def _full_transcript():
+    # Turns sent through the sidecar never reach this script, so fetch them from there
+    if not _uses_chat_server():
+        return st.session_state.transcript
+    response = httpx.get(
+        f"{CHAT_SERVER_URL}/sessions/{st.session_state.chat_session_id}",
+        headers={"Authorization": f"Bearer {CHAT_SERVER_TOKEN}"},
+        timeout=10
+    )
+    response.raise_for_status()
+    remote = response.json()["transcript"]
+    return "\n".join(filter(None, [st.session_state.transcript, remote]))
+
+@st.fragment
+def _render_generate():
+    # Generate minutes button (only show after some messages); clicking it reruns only this fragment
+    # Sidecar turns are not counted here, so the button is always offered in that mode
+    if st.session_state.turn_count > 3 or _uses_chat_server():
+        if st.button("Generate Meeting Minutes", type="primary"):
+            with st.spinner("Generating meeting minutes..."):
+                st.markdown(_cached_minutes(_full_transcript()))
 
 def main():
     st.title("Meeting Minutes Assistant")
     init_session_state()
 
-    # Initialize chat components
-    llm = initialize_llm()
-    chat_chain = create_interactive_chain(llm)
+    # Validate the API key once per session instead of on every rerun
+    if not st.session_state.get("env_ok"):
+        validate_env_vars()
+        st.session_state.env_ok = True
 
-    # Display chat messages
-    for message in st.session_state.messages:
-        with st.chat_message(message["role"]):
-            st.write(message["content"])
+    # Chat chain is an st.cache_resource, shared by every session on this server
+    chat_chain = get_interactive_chain()
 
-    # Generate minutes button (only show after some messages)
-    if len(st.session_state.messages) > 3:
-        if st.button("Generate Meeting Minutes", type="primary"):
-            all_responses = "\n".join(st.session_state.collected_responses)
-            with st.spinner("Generating meeting minutes..."):
-                results = process_meeting_data(all_responses)
-                st.markdown(results["meeting_minutes"])
+    # Display chat messages
+    _render_messages()
 
-    # Chat input
-    if user_input := st.chat_input("Type your response..."):
+    # Chat input; once the sidecar takes over, the component below has its own input
+    if not _uses_chat_server() and (user_input := st.chat_input("Type your response...")):
         # Handle option selection
         if st.session_state.get("waiting_for_option", False):
-            if user_input in ["1", "2"]:
-                st.session_state.waiting_for_option = False
-                if user_input == "1":
-                    next_message = "Please enter your meeting notes directly:"
-                else:
-                    next_message = """Let's start with some basic information:
- What is the name of the company?"""
-                
-                # Add user choice and bot's next message
-                st.session_state.messages.extend([
-                    {"role": "user", "content": user_input},
-                    {"role": "assistant", "content": next_message}
-                ])
-                st.session_state.collected_responses.append(user_input)
-                st.rerun()
-            else:
-                # Invalid option selected
-                st.session_state.messages.extend([
-                    {"role": "user", "content": user_input},
-                    {"role": "assistant", "content": "Please select either 1 or 2:"}
-                ])
-                st.rerun()
+            _handle_option(user_input)
         else:
             # Normal chat flow
             # Add user message
-            st.session_state.messages.append({"role": "user", "content": user_input})
-            st.session_state.collected_responses.append(user_input)
+            _add_message("user", user_input)
+            _record_response(user_input)
+
+            with st.chat_message("user"):
+                st.write(user_input)
 
-            # Get AI response
-            response = chat_chain.invoke({
-                "input": user_input,
-                "chat_history": st.session_state.chat_history
-            })
+            # Stream the AI response in place instead of rerunning the script
+            with st.chat_message("assistant"):
+                stream = chat_chain.stream({
+                    "input": user_input,
+                    "chat_history": list(st.session_state.chat_history)
+                })
+                full = st.write_stream(chunk.content for chunk in stream)
 
             # Add AI response
-            st.session_state.messages.append({"role": "assistant", "content": response.content})
+            _add_message("assistant", full)
+            # Contents are plain strings we produced ourselves, so skip pydantic validation
             st.session_state.chat_history.extend([
-                HumanMessage(content=user_input),
-                response
+                HumanMessage.model_construct(content=user_input),
+                AIMessage.model_construct(content=full)
             ])
-            
-            st.rerun()
+
+    # Checked after the chat input so choosing an option shows the component straight away
+    if _uses_chat_server():
+        _render_chat_component()
+
+    # Evaluated after the chat input so a new turn can reveal the button without an extra rerun
+    _render_generate()
 
 if __name__ == "__main__":
     main()